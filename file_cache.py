@@ -0,0 +1,120 @@
+"""File-backed cache for Yahoo Finance responses."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Optional, Tuple
+from logger import logger
+
+CACHE_DIR = ".cache"
+
+# Prices go stale quickly
+PRICE_CACHE_TTL_SECONDS = 60
+# Exchange rates only feed currency conversion, small intraday moves don't matter
+EXCHANGE_RATE_CACHE_TTL_SECONDS = 15 * 60
+# Symbols Yahoo doesn't know are skipped for a day instead of refetched every cycle
+NOT_FOUND_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+class FileCache:
+    """Stores JSON responses on disk keyed by ticker and endpoint."""
+    
+    def __init__(self, cache_dir: str = CACHE_DIR):
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+    
+    def _get_path(self, ticker: str, endpoint: str) -> str:
+        """
+        Get the cache file path for a ticker and endpoint.
+        
+        Args:
+            ticker: Ticker symbol
+            endpoint: Name of the cached endpoint (e.g. 'price')
+        
+        Returns:
+            Path of the cache file
+        """
+        # Hash the key since symbols like 'CAD=X' or '^GSPC' make poor file names
+        key = hashlib.md5(repr((ticker, endpoint)).encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def get(self, ticker: str, endpoint: str, ttl: float) -> Optional[Any]:
+        """
+        Get cached data if it is younger than the given TTL.
+        
+        Args:
+            ticker: Ticker symbol
+            endpoint: Name of the cached endpoint
+            ttl: Maximum age of the entry in seconds
+        
+        Returns:
+            Cached data or None if missing or expired
+        """
+        entry = self.get_entry(ticker, endpoint, ttl)
+        return entry[1] if entry is not None else None
+    
+    def get_entry(self, ticker: str, endpoint: str, ttl: float) -> Optional[Tuple[float, Any]]:
+        """
+        Get cached data and the time it was stored, if younger than the given TTL.
+        
+        Args:
+            ticker: Ticker symbol
+            endpoint: Name of the cached endpoint
+            ttl: Maximum age of the entry in seconds
+        
+        Returns:
+            Tuple of (timestamp, data) or None if missing or expired
+        """
+        path = self._get_path(ticker, endpoint)
+        
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+            ts, data = entry['ts'], entry['data']
+            age = time.time() - ts
+        except FileNotFoundError:
+            return None
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            # Drop it, otherwise every later lookup trips over the same file
+            logger.warning("Ignoring unreadable cache entry for %s (%s): %s", ticker, endpoint, e)
+            self._remove(path)
+            return None
+        
+        if age >= ttl:
+            logger.debug("Cache entry for %s (%s) expired", ticker, endpoint)
+            self._remove(path)
+            return None
+        
+        logger.debug("Cache hit for %s (%s)", ticker, endpoint)
+        return ts, data
+    
+    @staticmethod
+    def _remove(path: str) -> None:
+        """Delete a cache file, ignoring files that are already gone."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    
+    def set(self, ticker: str, endpoint: str, data: Any) -> None:
+        """
+        Store data in the cache.
+        
+        Args:
+            ticker: Ticker symbol
+            endpoint: Name of the cached endpoint
+            data: JSON-serializable data to store
+        """
+        path = self._get_path(ticker, endpoint)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump({'ts': time.time(), 'data': data}, f)
+            # Atomic rename so concurrent readers never see a partial file
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Failed to write cache entry for %s (%s): %s", ticker, endpoint, e)
+            self._remove(tmp_path)
@@ -25,6 +25,9 @@ def setup_logger(name: str = __name__) -> logging.Logger:
     
     logger.addHandler(console_handler)
     
+    # Don't print handler errors (e.g. a closed stdout) outside of debugging
+    logging.raiseExceptions = LOG_LEVEL.upper() == 'DEBUG'
+    
     return logger
 
 
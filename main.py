@@ -11,12 +11,38 @@ This is the refactored version of the original getStock.py with improved:
 
 import sys
 import signal
+import asyncio
+import logging
+import random
+from datetime import datetime
 from typing import Set
+from yfinance.exceptions import YFRateLimitError
 from logger import logger
 from config import SKIP_TICKERS
 from stock_fetcher import StockDataFetcher
 from sheets_client import SheetsClient
-from scheduler import UpdateScheduler
+from scheduler import UpdateScheduler, MARKET_TZ
+
+# Upper bound for the exponential backoff after rate limit errors
+MAX_BACKOFF_SECONDS = 300
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    """
+    Check if an error means Yahoo Finance or Google Sheets is rate limiting us.
+    
+    Args:
+        error: Exception raised during an update cycle
+        
+    Returns:
+        True if the request was rejected with HTTP 429
+    """
+    if isinstance(error, YFRateLimitError):
+        return True
+    
+    # HTTP errors from curl_cffi/requests and gspread APIError all carry the response
+    response = getattr(error, 'response', None)
+    return getattr(response, 'status_code', None) == 429
 
 
 class StockDataApp:
@@ -25,17 +51,15 @@ class StockDataApp:
     def __init__(self):
         self.stock_fetcher = StockDataFetcher()
         self.sheets_client = SheetsClient()
-        self.scheduler = UpdateScheduler()
-        self.running = True
-        
-        # Set up signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        self.stop_event = asyncio.Event()
+        self.scheduler = UpdateScheduler(self.stop_event)
+        self._skip_set = frozenset(SKIP_TICKERS)
     
-    def _signal_handler(self, signum, frame):
+    def _signal_handler(self, signum):
         """Handle shutdown signals gracefully."""
         logger.info(f"Received signal {signum}, shutting down gracefully...")
-        self.running = False
+        self.stop_event.set()
+        self.stock_fetcher.stop()
     
     def _filter_tickers(self, tickers: list) -> list:
         """
@@ -47,19 +71,16 @@ class StockDataApp:
         Returns:
             Filtered list of valid tickers
         """
-        valid_tickers = []
-        skip_set = set(SKIP_TICKERS)
+        # Cells containing '@' hold the timestamp, not a ticker
+        valid_tickers = [ticker for ticker in (t.strip() for t in tickers)
+                         if ticker and ticker not in self._skip_set and "@" not in ticker]
         
-        for ticker in tickers:
-            ticker_clean = ticker.strip()
-            if ticker_clean and ticker_clean not in skip_set and ticker_clean.find("@") == -1:
-                valid_tickers.append(ticker_clean)
-            else:
-                logger.debug(f"Skipping ticker: '{ticker}'")
+        if len(valid_tickers) < len(tickers):
+            logger.debug(f"Skipped {len(tickers) - len(valid_tickers)} tickers")
         
         return valid_tickers
     
-    def perform_update(self) -> bool:
+    async def perform_update(self) -> bool:
         """
         Perform a single update cycle.
         
@@ -70,7 +91,7 @@ class StockDataApp:
             logger.info("Starting update cycle")
             
             # Get tickers from spreadsheet
-            all_tickers = self.sheets_client.get_tickers()
+            all_tickers = await asyncio.to_thread(self.sheets_client.get_tickers)
             if not all_tickers:
                 logger.warning("No tickers found in spreadsheet")
                 return False
@@ -84,8 +105,8 @@ class StockDataApp:
             
             logger.info(f"Processing {len(valid_tickers)} valid tickers")
             
-            # Fetch stock prices
-            ticker_prices = self.stock_fetcher.get_multiple_prices(valid_tickers)
+            # Fetch stock prices and the exchange rate in the same batched requests
+            ticker_prices, exchange_rate = await self.stock_fetcher.aget_prices_and_rate(valid_tickers, "CAD=X")
             
             # Count successful fetches
             successful_prices = {k: v for k, v in ticker_prices.items() if v is not None}
@@ -98,25 +119,25 @@ class StockDataApp:
                 logger.error("No prices were successfully fetched")
                 return False
             
-            # Update prices in spreadsheet
-            price_update_success = self.sheets_client.update_prices(ticker_prices)
+            # Queue changed prices; everything is written in one batch below.
+            # Reuse the ticker row read above instead of fetching it again
+            updates = self.sheets_client.build_price_updates(ticker_prices, tickers=all_tickers)
+            
+            # Queue exchange rate
+            if exchange_rate is not None:
+                updates.append(self.sheets_client.build_exchange_rate_update(exchange_rate))
+            else:
+                logger.warning("Failed to fetch CAD exchange rate")
+            
+            # Queue timestamp
+            updates.append(self.sheets_client.build_timestamp_update())
             
-            if not price_update_success:
+            if not await asyncio.to_thread(self.sheets_client.flush_batch, updates):
                 logger.error("Failed to update prices in spreadsheet")
                 return False
             
-            # Update exchange rate
-            exchange_rate = self.stock_fetcher.get_exchange_rate("CAD=X")
             if exchange_rate is not None:
-                self.sheets_client.update_exchange_rate(exchange_rate)
                 logger.info(f"Updated CAD exchange rate: {exchange_rate}")
-            else:
-                logger.warning("Failed to fetch CAD exchange rate")
-            
-            # Update timestamp
-            timestamp_success = self.sheets_client.update_timestamp()
-            if not timestamp_success:
-                logger.warning("Failed to update timestamp")
             
             # Mark update as completed
             self.scheduler.mark_update_completed()
@@ -127,16 +148,31 @@ class StockDataApp:
             return True
             
         except Exception as e:
-            logger.error(f"Update cycle failed with error: {e}", exc_info=True)
+            if _is_rate_limit_error(e):
+                # Let the main loop back off before the next attempt
+                raise
+            # Formatting tracebacks on every failed cycle is wasted work unless debugging
+            logger.error(f"Update cycle failed with error: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
             return False
     
-    def run(self):
+    async def run(self):
         """Main application loop."""
         logger.info("Stock Data Application starting up")
         
+        # Set up signal handlers for graceful shutdown
+        loop = asyncio.get_running_loop()
+        loop_handled = []
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, self._signal_handler, signum)
+                loop_handled.append(signum)
+            except NotImplementedError:
+                # Windows event loops don't support signal handlers, hand the signal over to the loop instead
+                signal.signal(signum, lambda s, f: loop.call_soon_threadsafe(self._signal_handler, s))
+        
         try:
             # Display sheet info
-            sheet_info = self.sheets_client.get_sheet_info()
+            sheet_info = await asyncio.to_thread(self.sheets_client.get_sheet_info)
             if sheet_info:
                 logger.info(f"Connected to spreadsheet: {sheet_info.get('title', 'Unknown')}")
             
@@ -145,39 +181,54 @@ class StockDataApp:
             logger.info(f"Market status: {'Open' if market_status['is_market_open'] else 'Closed'}")
             
             # Main loop
-            while self.running:
+            rate_limit_attempt = 0
+            while not self.stop_event.is_set():
                 try:
-                    # Check if we should perform an update
-                    if self.scheduler.should_update():
-                        success = self.perform_update()
-                        if not success:
+                    # Check if we should perform an update, using one timestamp for the decision
+                    now = datetime.now(MARKET_TZ)
+                    if self.scheduler.should_update(now=now):
+                        success = await self.perform_update()
+                        if success:
+                            rate_limit_attempt = 0
+                        else:
                             logger.warning("Update cycle failed, will retry at next interval")
                     
-                    # Wait until next update time
-                    if self.running:  # Check if we're still supposed to be running
-                        self.scheduler.wait_until_next_update()
+                    # Wait until next update time, waking early on shutdown
+                    if not self.stop_event.is_set():
+                        await self.scheduler.wait_until_next_update()
                         
-                except KeyboardInterrupt:
-                    logger.info("Received keyboard interrupt, shutting down...")
-                    break
                 except Exception as e:
-                    logger.error(f"Unexpected error in main loop: {e}", exc_info=True)
-                    # Continue running but wait a bit before retrying
-                    if self.running:
+                    if _is_rate_limit_error(e):
+                        # Back off exponentially, with jitter, until the rate limit clears
+                        rate_limit_attempt += 1
+                        delay = min(MAX_BACKOFF_SECONDS, 2 ** rate_limit_attempt) + random.uniform(0, 1)
+                        logger.warning(f"Rate limited ({e}), waiting {delay:.0f} seconds before retrying...")
+                    else:
+                        logger.error(f"Unexpected error in main loop: {e}", 
+                                     exc_info=logger.isEnabledFor(logging.DEBUG))
+                        # Continue running but wait a bit before retrying
+                        delay = 60
                         logger.info("Waiting 60 seconds before retrying...")
-                        import time
-                        time.sleep(60)
+                    
+                    if not self.stop_event.is_set():
+                        try:
+                            await asyncio.wait_for(self.stop_event.wait(), timeout=delay)
+                        except asyncio.TimeoutError:
+                            pass
         
         except Exception as e:
             logger.error(f"Fatal error in application: {e}", exc_info=True)
             return 1
         
         finally:
+            for signum in loop_handled:
+                loop.remove_signal_handler(signum)
+            self.stock_fetcher.close()
             logger.info("Stock Data Application shutting down")
         
         return 0
     
-    def run_once(self) -> bool:
+    async def run_once(self) -> bool:
         """
         Run a single update cycle without scheduling.
         Useful for testing or manual runs.
@@ -186,7 +237,10 @@ class StockDataApp:
             True if successful, False otherwise
         """
         logger.info("Running single update cycle")
-        return self.perform_update()
+        try:
+            return await self.perform_update()
+        finally:
+            self.stock_fetcher.close()
 
 
 def main():
@@ -204,6 +258,11 @@ def main():
     # Adjust log level if debug is requested
     if args.debug:
         logger.setLevel('DEBUG')
+        # The console handler filters on LOG_LEVEL too, lower it so debug records get through
+        for handler in logger.handlers:
+            handler.setLevel('DEBUG')
+        # Surface handler errors again, setup_logger only enables them for a DEBUG LOG_LEVEL
+        logging.raiseExceptions = True
         logger.info("Debug logging enabled")
     
     # Create and run the application
@@ -212,11 +271,11 @@ def main():
     try:
         if args.once:
             # Run once and exit
-            success = app.run_once()
+            success = asyncio.run(app.run_once())
             return 0 if success else 1
         else:
             # Run continuously
-            return app.run()
+            return asyncio.run(app.run())
     
     except KeyboardInterrupt:
         logger.info("Application interrupted by user")
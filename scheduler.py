@@ -1,24 +1,33 @@
 """Scheduling and timing utilities for stock data updates."""
 
-import time
+import asyncio
 from datetime import datetime, timedelta
 from typing import Optional
+from zoneinfo import ZoneInfo
 from logger import logger
 from config import MARKET_OPEN_HOUR, MARKET_CLOSE_HOUR, UPDATE_INTERVAL_MINUTES
 
+# Market hours are US/Eastern regardless of where the process runs
+MARKET_TZ = ZoneInfo("America/New_York")
+
 
 class UpdateScheduler:
     """Handles scheduling and timing for stock data updates."""
     
-    def __init__(self):
+    def __init__(self, stop_event: Optional[asyncio.Event] = None):
+        # Ends any pending wait early when set
+        self.stop_event = stop_event
         self.last_update = None
     
-    def wait_until_next_update(self) -> None:
+    async def wait_until_next_update(self, now: Optional[datetime] = None) -> None:
         """
-        Wait until it's time for the next update.
+        Wait until it's time for the next update, or until the stop event is set.
         Considers market hours and update intervals.
+        
+        Args:
+            now: Current datetime, defaults to datetime.now(MARKET_TZ)
         """
-        current_time = datetime.now()
+        current_time = now or datetime.now(MARKET_TZ)
         logger.debug(f"Current time: {current_time.strftime('%H:%M:%S')}")
         
         # Check if we're outside market hours
@@ -32,7 +41,14 @@ class UpdateScheduler:
         
         if wait_seconds > 0:
             logger.debug(f"Sleeping for {wait_seconds} seconds")
-            time.sleep(wait_seconds)
+            if self.stop_event is None:
+                await asyncio.sleep(wait_seconds)
+                return
+                
+            try:
+                await asyncio.wait_for(self.stop_event.wait(), timeout=wait_seconds)
+            except asyncio.TimeoutError:
+                pass
     
     def _is_outside_market_hours(self, current_time: datetime) -> bool:
         """
@@ -77,7 +93,8 @@ class UpdateScheduler:
                 microsecond=0
             )
         
-        wait_seconds = int((target_time - current_time).total_seconds())
+        # Compare timestamps so DST transitions don't skew the wait
+        wait_seconds = int(target_time.timestamp() - current_time.timestamp())
         return max(0, wait_seconds)
     
     def _calculate_wait_until_next_interval(self, current_time: datetime) -> int:
@@ -103,15 +120,17 @@ class UpdateScheduler:
         else:
             target_time = current_time.replace(minute=next_interval, second=0, microsecond=0)
         
-        wait_seconds = int((target_time - current_time).total_seconds())
+        # Compare timestamps so DST transitions don't skew the wait
+        wait_seconds = int(target_time.timestamp() - current_time.timestamp())
         return max(0, wait_seconds)
     
-    def should_update(self, force: bool = False) -> bool:
+    def should_update(self, force: bool = False, now: Optional[datetime] = None) -> bool:
         """
         Check if an update should be performed now.
         
         Args:
             force: Force update regardless of timing
+            now: Current datetime, defaults to datetime.now(MARKET_TZ)
             
         Returns:
             True if update should be performed
@@ -120,7 +139,7 @@ class UpdateScheduler:
             logger.debug("Force update requested")
             return True
         
-        current_time = datetime.now()
+        current_time = now or datetime.now(MARKET_TZ)
         
         # Don't update outside market hours
         if self._is_outside_market_hours(current_time):
@@ -144,17 +163,20 @@ class UpdateScheduler:
     
     def mark_update_completed(self) -> None:
         """Mark that an update has been completed."""
-        self.last_update = datetime.now()
+        self.last_update = datetime.now(MARKET_TZ)
         logger.debug(f"Update completed at {self.last_update.strftime('%H:%M:%S')}")
     
-    def get_next_update_time(self) -> Optional[datetime]:
+    def get_next_update_time(self, now: Optional[datetime] = None) -> Optional[datetime]:
         """
         Get the estimated time of the next update.
         
+        Args:
+            now: Current datetime, defaults to datetime.now(MARKET_TZ)
+            
         Returns:
             Next update datetime or None if unknown
         """
-        current_time = datetime.now()
+        current_time = now or datetime.now(MARKET_TZ)
         
         if self._is_outside_market_hours(current_time):
             # Next update is when market opens
@@ -184,14 +206,17 @@ class UpdateScheduler:
             else:
                 return current_time.replace(minute=next_interval, second=0, microsecond=0)
     
-    def get_market_status(self) -> dict:
+    def get_market_status(self, now: Optional[datetime] = None) -> dict:
         """
         Get current market status information.
         
+        Args:
+            now: Current datetime, defaults to datetime.now(MARKET_TZ)
+            
         Returns:
             Dictionary with market status details
         """
-        current_time = datetime.now()
+        current_time = now or datetime.now(MARKET_TZ)
         is_market_open = not self._is_outside_market_hours(current_time)
         
         return {
@@ -201,5 +226,5 @@ class UpdateScheduler:
             'market_close_hour': MARKET_CLOSE_HOUR,
             'update_interval_minutes': UPDATE_INTERVAL_MINUTES,
             'last_update': self.last_update.strftime('%H:%M:%S') if self.last_update else None,
-            'next_update': self.get_next_update_time()
+            'next_update': self.get_next_update_time(current_time)
         }
@@ -1,13 +1,36 @@
 """Google Sheets client for stock data updates."""
 
 import gspread
+from gspread.utils import cell_list_to_rect, rowcol_to_a1
+from google.auth.exceptions import RefreshError
 from google.oauth2.service_account import Credentials
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, Callable
 from logger import logger
 from config import SCOPES, CREDENTIALS_FILE, SPREADSHEET_ID, TICKER_ROW, PRICE_ROW
 from datetime import datetime
 
 
+def _is_rate_limited(error: Exception) -> bool:
+    """Check if an error is the Sheets API rejecting us for exceeding quota."""
+    return isinstance(error, gspread.exceptions.APIError) and error.response.status_code == 429
+
+
+def _compute_column_letter(col_num: int) -> str:
+    """Convert column number to letter (A, B, C, ..., AA, AB, etc.)."""
+    string = ""
+    while col_num > 0:
+        col_num, remainder = divmod(col_num - 1, 26)
+        string = chr(65 + remainder) + string
+    return string
+
+
+# Relative price change below which a cell is not rewritten
+PRICE_CHANGE_THRESHOLD = 0.0001
+
+# Column letters precomputed for the sheet sizes we actually use (index 0 is unused)
+_COLUMN_LETTERS = tuple(_compute_column_letter(i) for i in range(4096))
+
+
 class SheetsClient:
     """Handles Google Sheets operations."""
     
@@ -17,6 +40,9 @@ class SheetsClient:
         self._client = None
         self._spreadsheet = None
         self._worksheet = None
+        # Last price written per (ticker, column), and the ones waiting for flush_batch
+        self._last_prices: Dict[Tuple[str, int], float] = {}
+        self._pending_prices: Dict[Tuple[str, int], float] = {}
     
     @property
     def client(self):
@@ -61,6 +87,28 @@ class SheetsClient:
                 raise
         return self._worksheet
     
+    def _with_reauth(self, operation: Callable[[], Any]) -> Any:
+        """
+        Run a Sheets operation, re-authorizing once if the token refresh fails.
+        
+        The client is kept for the lifetime of the process, so an expired or
+        revoked token only costs a new authorization when it actually happens.
+        
+        Args:
+            operation: Callable that accesses the lazy client properties
+            
+        Returns:
+            Result of the operation
+        """
+        try:
+            return operation()
+        except RefreshError as e:
+            logger.warning(f"Google Sheets credentials refresh failed ({e}), re-authorizing")
+            self._client = None
+            self._spreadsheet = None
+            self._worksheet = None
+            return operation()
+    
     def get_tickers(self, row: int = TICKER_ROW) -> List[str]:
         """
         Get ticker symbols from the specified row.
@@ -73,61 +121,150 @@ class SheetsClient:
         """
         try:
             logger.debug(f"Reading tickers from row {row}")
-            tickers = self.worksheet.row_values(row)
+            tickers = self._with_reauth(lambda: self.worksheet.row_values(row))
             # Remove empty strings and clean up
             cleaned_tickers = [ticker.strip() for ticker in tickers if ticker.strip()]
             logger.info(f"Found {len(cleaned_tickers)} tickers")
             return cleaned_tickers
         except Exception as e:
+            if _is_rate_limited(e):
+                raise
             logger.error(f"Failed to get tickers from row {row}: {e}")
             return []
     
-    def update_prices(self, ticker_prices: Dict[str, Optional[float]], 
-                     ticker_row: int = TICKER_ROW, price_row: int = PRICE_ROW) -> bool:
+    def build_price_updates(self, ticker_prices: Dict[str, Optional[float]], 
+                            tickers: Optional[List[str]] = None,
+                            ticker_row: int = TICKER_ROW, price_row: int = PRICE_ROW) -> List[Dict[str, Any]]:
         """
-        Update prices in the spreadsheet.
+        Build batch update entries for ticker prices.
         
         Args:
             ticker_prices: Dictionary mapping ticker to price
+            tickers: Tickers already read from ticker_row, read from the sheet if None
             ticker_row: Row containing ticker symbols
             price_row: Row to update with prices
             
+        Returns:
+            List of update entries for flush_batch, empty if no price changed
+        """
+        if tickers is None:
+            tickers = self.get_tickers(ticker_row)
+        
+        cells = []
+        self._pending_prices = {}
+        
+        for col_index, ticker in enumerate(tickers, start=1):
+            price = ticker_prices.get(ticker)
+            if price is None:
+                continue
+            
+            # Skip cells whose last written price is still current
+            last_price = self._last_prices.get((ticker, col_index))
+            if last_price and abs(price - last_price) / last_price <= PRICE_CHANGE_THRESHOLD:
+                continue
+            
+            # enumerate starts at 1 to match gspread's 1-based columns
+            cells.append(gspread.Cell(price_row, col_index, price))
+            self._pending_prices[(ticker, col_index)] = price
+            logger.debug(f"Prepared update for {ticker}: ${price} at {cells[-1].address}")
+        
+        if not cells:
+            logger.debug("No price changed since the last update")
+            return []
+        
+        # All prices share one row, so send them as a single range; gaps are None,
+        # which the Sheets API leaves untouched
+        start = rowcol_to_a1(price_row, cells[0].col)
+        end = rowcol_to_a1(price_row, cells[-1].col)
+        return [{'range': f"{start}:{end}", 'values': cell_list_to_rect(cells)}]
+    
+    def build_timestamp_update(self, cell: Tuple[int, int] = None) -> Dict[str, Any]:
+        """
+        Build a batch update entry for the timestamp cell.
+        
+        Args:
+            cell: Tuple of (row, col), defaults to config value
+            
+        Returns:
+            Update entry for flush_batch
+        """
+        from config import TIMESTAMP_CELL
+        cell = cell or TIMESTAMP_CELL
+        
+        timestamp = datetime.now().strftime("%I:%M%p @ %Y-%m-%d")
+        logger.debug(f"Prepared timestamp update: {timestamp}")
+        
+        return {'range': f"{self._get_column_letter(cell[1])}{cell[0]}", 'values': [[timestamp]]}
+    
+    def build_exchange_rate_update(self, rate: float, cell: Tuple[int, int] = None) -> Dict[str, Any]:
+        """
+        Build a batch update entry for the exchange rate cell.
+        
+        Args:
+            rate: Exchange rate value
+            cell: Tuple of (row, col), defaults to config value
+            
+        Returns:
+            Update entry for flush_batch
+        """
+        from config import CAD_EXCHANGE_CELL
+        cell = cell or CAD_EXCHANGE_CELL
+        
+        logger.debug(f"Prepared exchange rate update: {rate}")
+        return {'range': f"{self._get_column_letter(cell[1])}{cell[0]}", 'values': [[rate]]}
+    
+    def flush_batch(self, updates: List[Dict[str, Any]]) -> bool:
+        """
+        Write all queued updates with a single Sheets API request.
+        
+        Args:
+            updates: List of {'range': ..., 'values': ...} entries
+            
         Returns:
             True if successful, False otherwise
         """
-        try:
-            logger.info(f"Updating prices for {len(ticker_prices)} tickers")
+        if not updates:
+            logger.warning("No updates to write")
+            return False
             
-            # Get current tickers from the sheet
-            tickers = self.get_tickers(ticker_row)
+        try:
+            logger.debug(f"Writing {len(updates)} ranges in one batch")
+            self._with_reauth(lambda: self.worksheet.batch_update(updates, value_input_option='RAW'))
+            logger.info(f"Successfully wrote {len(updates)} ranges")
             
-            # Build list of updates
-            updates = []
-            updated_count = 0
-            
-            for col_index, ticker in enumerate(tickers, start=1):
-                if ticker in ticker_prices and ticker_prices[ticker] is not None:
-                    # Convert to 1-based indexing for gspread
-                    cell_address = f"{self._get_column_letter(col_index)}{price_row}"
-                    updates.append({
-                        'range': cell_address,
-                        'values': [[ticker_prices[ticker]]]
-                    })
-                    updated_count += 1
-                    logger.debug(f"Prepared update for {ticker}: ${ticker_prices[ticker]} at {cell_address}")
-            
-            if updates:
-                # Batch update for efficiency
-                self.worksheet.batch_update(updates)
-                logger.info(f"Successfully updated {updated_count} prices")
-                return True
-            else:
-                logger.warning("No valid prices to update")
-                return False
-                
+            # Prices are only known to be in the sheet once the write succeeded
+            self._last_prices.update(self._pending_prices)
+            self._pending_prices = {}
+            return True
         except Exception as e:
-            logger.error(f"Failed to update prices: {e}")
+            if _is_rate_limited(e):
+                raise
+            logger.error(f"Failed to write batch update: {e}")
+            return False
+    
+    def update_prices(self, ticker_prices: Dict[str, Optional[float]], 
+                     tickers: Optional[List[str]] = None,
+                     ticker_row: int = TICKER_ROW, price_row: int = PRICE_ROW) -> bool:
+        """
+        Update prices in the spreadsheet.
+        
+        Args:
+            ticker_prices: Dictionary mapping ticker to price
+            tickers: Tickers already read from ticker_row, read from the sheet if None
+            ticker_row: Row containing ticker symbols
+            price_row: Row to update with prices
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        logger.info(f"Updating prices for {len(ticker_prices)} tickers")
+        
+        updates = self.build_price_updates(ticker_prices, tickers, ticker_row, price_row)
+        if not updates:
+            logger.warning("No valid or changed prices to update")
             return False
+            
+        return self.flush_batch(updates)
     
     def update_cell(self, row: int, col: int, value: Any) -> bool:
         """
@@ -143,7 +280,7 @@ class SheetsClient:
         """
         try:
             logger.debug(f"Updating cell ({row}, {col}) with value: {value}")
-            self.worksheet.update_cell(row, col, value)
+            self._with_reauth(lambda: self.worksheet.update_cell(row, col, value))
             logger.debug(f"Successfully updated cell ({row}, {col})")
             return True
         except Exception as e:
@@ -195,11 +332,9 @@ class SheetsClient:
         Returns:
             Column letter string
         """
-        string = ""
-        while col_num > 0:
-            col_num, remainder = divmod(col_num - 1, 26)
-            string = chr(65 + remainder) + string
-        return string
+        if 0 <= col_num < len(_COLUMN_LETTERS):
+            return _COLUMN_LETTERS[col_num]
+        return _compute_column_letter(col_num)
     
     def get_sheet_info(self) -> Dict[str, Any]:
         """
@@ -209,13 +344,13 @@ class SheetsClient:
             Dictionary with sheet information
         """
         try:
-            return {
+            return self._with_reauth(lambda: {
                 'title': self.spreadsheet.title,
                 'sheet_count': len(self.spreadsheet.worksheets()),
                 'current_sheet': self.worksheet.title,
                 'row_count': self.worksheet.row_count,
                 'col_count': self.worksheet.col_count
-            }
+            })
         except Exception as e:
             logger.error(f"Failed to get sheet info: {e}")
             return {}
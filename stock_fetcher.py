@@ -1,17 +1,118 @@
 """Stock data fetching functionality."""
 
+import asyncio
+import random
+import threading
+import time
+import urllib.parse
 import yfinance as yf
-from typing import Optional, Dict, Any, List
+from yfinance.exceptions import YFRateLimitError
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from curl_cffi import requests as curl_requests
+from pyrate_limiter import Duration, Limiter, RequestRate
+from typing import Optional, Dict, Any, List, Mapping, Tuple
 from logger import logger
 from config import MAX_RETRIES, RETRY_DELAY_SECONDS
-import time
+from file_cache import (FileCache, PRICE_CACHE_TTL_SECONDS, EXCHANGE_RATE_CACHE_TTL_SECONDS,
+                        NOT_FOUND_CACHE_TTL_SECONDS)
+
+# Yahoo quote endpoint; accepts a comma-separated list of up to 20 symbols
+QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+QUOTE_BATCH_SIZE = 20
+# A failed chunk request is tried once more before its tickers fall back to per-ticker lookups
+QUOTE_ATTEMPTS = 2
+# Chart endpoint; its metadata carries the current price and needs no crumb
+CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{}"
+COOKIE_URL = "https://fc.yahoo.com"
+CRUMB_URL = "https://query1.finance.yahoo.com/v1/test/getcrumb"
+
+# Yahoo starts throttling at roughly 60 requests per minute
+YAHOO_REQUEST_RATE = RequestRate(60, Duration.MINUTE)
+MAX_WORKERS = 8
+# (connect, read) seconds per request, so one slow ticker can't hold a worker for long
+REQUEST_TIMEOUT = (3, 10)
+# Quote chunks in flight at once on the event loop; coroutines are cheap, the limiter paces them
+ASYNC_MAX_CONCURRENCY = 50
+# Oldest exchange rate still used when a refetch fails, older ones would mislead the sheet
+MAX_STALE_RATE_AGE_SECONDS = 4 * 60 * 60
+# Cap for the exponential backoff between retries of a single ticker
+MAX_RETRY_DELAY_SECONDS = 60
+# How often async retry waits check whether the fetcher was stopped
+STOP_POLL_INTERVAL_SECONDS = 0.2
+
+# Price fields in order of preference, shared by quotes, chart metadata and info
+PRICE_FIELDS = ('currentPrice', 'regularMarketPrice', 'previousClose', 'open')
+
+
+def _to_price(value: Any) -> Optional[float]:
+    """Convert a quote field to a price, or None if it isn't a positive number."""
+    try:
+        price = float(value)
+    except (ValueError, TypeError):
+        return None
+    return price if price > 0 else None
+
+
+def _is_transient_error(error: Exception) -> bool:
+    """Check whether a failed request is worth retrying."""
+    if isinstance(error, curl_requests.exceptions.HTTPError):
+        # 4xx answers (unknown symbol, bad request) won't change on retry
+        status = getattr(error.response, 'status_code', None)
+        return status is None or status >= 500
+    return isinstance(error, (curl_requests.exceptions.ConnectionError, 
+                              curl_requests.exceptions.Timeout))
+
+
+class RateLimitedSession(curl_requests.Session):
+    """curl_cffi session that paces every request through a shared limiter."""
+    
+    def __init__(self, limiter: Limiter, **kwargs):
+        super().__init__(**kwargs)
+        self.limiter = limiter
+    
+    def request(self, *args, **kwargs):
+        # yfinance passes its own 30 second timeout, keep the session's shorter one
+        kwargs['timeout'] = self.timeout
+        with self.limiter.ratelimit('yahoo', delay=True):
+            return super().request(*args, **kwargs)
 
 
 class StockDataFetcher:
     """Handles fetching stock data from Yahoo Finance."""
     
-    def __init__(self):
-        self.session = None
+    def __init__(self, cache: Optional[FileCache] = None, max_workers: int = MAX_WORKERS):
+        # Shared by all worker threads so the combined request rate stays capped
+        self.limiter = Limiter(YAHOO_REQUEST_RATE)
+        # Yahoo rejects plain requests clients, so use a browser-impersonating
+        # curl_cffi session (the same kind yfinance uses) and reuse it across calls,
+        # including the requests yfinance makes itself
+        self.session = RateLimitedSession(self.limiter, impersonate="chrome", timeout=REQUEST_TIMEOUT)
+        self._crumb = None
+        self._crumb_lock = threading.Lock()
+        self.cache = cache or FileCache()
+        # Concurrent requests per call; more than ~8 tends to trigger Yahoo throttling
+        self.max_workers = max_workers
+        # Set on shutdown so worker threads stop sleeping between retries
+        self._stop = threading.Event()
+        # Per-ticker lookups in progress, so concurrent callers share one fetch
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        # Last fetched (timestamp, rate) per currency pair, also used when a refetch fails
+        self._rates: Dict[str, Tuple[float, float]] = {}
+    
+    def stop(self) -> None:
+        """Abandon pending retries so shutdown isn't held up by worker threads."""
+        self._stop.set()
+    
+    def close(self) -> None:
+        """Close the shared session and its pooled connections."""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
         
     def get_ticker_price(self, ticker: str) -> Optional[float]:
         """
@@ -24,79 +125,380 @@ class StockDataFetcher:
             Current price or None if unable to fetch
         """
         if not ticker or ticker.strip() == '':
-            logger.warning(f"Empty ticker symbol provided")
+            logger.warning("Empty ticker symbol provided")
             return None
             
         ticker = ticker.strip().upper()
-        logger.debug(f"Fetching price for ticker: {ticker}")
         
-        for attempt in range(MAX_RETRIES):
+        cached_price = self.cache.get(ticker, 'price', PRICE_CACHE_TTL_SECONDS)
+        if cached_price is not None:
+            return cached_price
+        if self._is_known_missing(ticker):
+            return None
+        
+        return self._fetch_shared(ticker)
+    
+    def _fetch_shared(self, ticker: str, attempts: int = MAX_RETRIES) -> Optional[float]:
+        """
+        Fetch the price of a normalized ticker symbol, joining a fetch already in flight.
+        
+        Args:
+            ticker: Stripped, upper-case ticker symbol
+            attempts: Maximum number of fetch attempts
+            
+        Returns:
+            Current price or None if unable to fetch
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(ticker)
+            owner = future is None
+            if owner:
+                future = self._inflight[ticker] = Future()
+        
+        if not owner:
+            logger.debug("Waiting for in-flight fetch of %s", ticker)
+            return future.result()
+        
+        try:
+            price = self._fetch_ticker_price(ticker, attempts)
+            future.set_result(price)
+            return price
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[ticker]
+    
+    def _fetch_ticker_price(self, ticker: str, attempts: int = MAX_RETRIES) -> Optional[float]:
+        """
+        Fetch the price of a normalized ticker symbol, retrying on failure.
+        
+        Args:
+            ticker: Stripped, upper-case ticker symbol
+            attempts: Maximum number of fetch attempts
+            
+        Returns:
+            Current price or None if unable to fetch
+        """
+        logger.debug("Fetching price for ticker: %s", ticker)
+        
+        for attempt in range(attempts):
             try:
-                ticker_obj = yf.Ticker(ticker)
-                info = ticker_obj.info
+                price = self._extract_price_from_info(self._get_chart_metadata(ticker))
                 
-                if not info:
-                    logger.warning(f"No info available for ticker {ticker}")
-                    continue
-                
-                # Try different price fields in order of preference
-                price = self._extract_price_from_info(info)
+                if price is None:
+                    # Fall back to the full info payload, which also carries bid/ask
+                    info = self._get_info(ticker)
+                    
+                    if not info or info.get('quoteType') is None:
+                        # yfinance hides HTTP errors behind an empty info, so this may be an outage
+                        logger.warning("No info available for ticker %s (attempt %d)", ticker, attempt + 1)
+                    else:
+                        # Try different price fields in order of preference
+                        price = self._extract_price_from_info(info)
+                        
+                        if price is None:
+                            # Yahoo knows the symbol but has no usable price, asking again won't help
+                            logger.warning("No valid price found for %s", ticker)
+                            break
                 
                 if price is not None:
-                    logger.debug(f"Successfully fetched price for {ticker}: ${price}")
+                    logger.debug("Successfully fetched price for %s: $%s", ticker, price)
+                    self.cache.set(ticker, 'price', price)
                     return price
-                    
-                logger.warning(f"No valid price found for {ticker} in attempt {attempt + 1}")
                 
+            except YFRateLimitError:
+                # Retrying right away only prolongs the throttling, let the caller back off
+                raise
             except Exception as e:
-                logger.error(f"Error fetching data for {ticker} (attempt {attempt + 1}): {e}")
+                logger.error("Error fetching data for %s (attempt %d): %s", ticker, attempt + 1, e)
+                if getattr(getattr(e, 'response', None), 'status_code', None) == 404:
+                    self._mark_missing(ticker)
+                if not _is_transient_error(e):
+                    break
                 
-            if attempt < MAX_RETRIES - 1:
-                logger.debug(f"Retrying in {RETRY_DELAY_SECONDS} seconds...")
-                time.sleep(RETRY_DELAY_SECONDS)
+            if attempt < attempts - 1:
+                # Jitter keeps parallel workers from retrying in lockstep
+                delay = min(MAX_RETRY_DELAY_SECONDS, RETRY_DELAY_SECONDS * 2 ** attempt) + random.uniform(0, 1)
+                logger.debug("Retrying in %.1f seconds...", delay)
+                if self._stop.wait(delay):
+                    logger.info("Shutting down, giving up on %s", ticker)
+                    return None
         
-        logger.error(f"Failed to fetch price for {ticker} after {MAX_RETRIES} attempts")
+        logger.error("Failed to fetch price for %s after %d attempt(s)", ticker, attempt + 1)
         return None
     
-    def _extract_price_from_info(self, info: Dict[str, Any]) -> Optional[float]:
+    def _get_info(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the full yfinance info payload of a ticker.
+        
+        Args:
+            ticker: Stripped, upper-case ticker symbol
+            
+        Returns:
+            Info dictionary, or None if yfinance failed to produce one
+        """
+        try:
+            return yf.Ticker(ticker, session=self.session).info
+        except YFRateLimitError:
+            raise
+        except Exception as e:
+            # yfinance catches the HTTP error itself, what surfaces here (often a
+            # TypeError) says nothing about whether the symbol exists
+            logger.debug("yfinance info for %s failed: %s", ticker, e)
+            return None
+    
+    def _mark_missing(self, ticker: str) -> None:
+        """
+        Remember that Yahoo doesn't know a symbol, so it isn't refetched every cycle.
+        
+        Args:
+            ticker: Stripped, upper-case ticker symbol
+        """
+        logger.info("Skipping %s for %d hours, Yahoo doesn't know it", 
+                    ticker, NOT_FOUND_CACHE_TTL_SECONDS // 3600)
+        self.cache.set(ticker, 'not_found', True)
+    
+    def _is_known_missing(self, ticker: str) -> bool:
+        """
+        Check whether a symbol was recently found not to exist.
+        
+        Args:
+            ticker: Stripped, upper-case ticker symbol
+            
+        Returns:
+            True if the symbol should not be fetched
+        """
+        return self.cache.get(ticker, 'not_found', NOT_FOUND_CACHE_TTL_SECONDS) is not None
+    
+    def _get_chart_metadata(self, ticker: str) -> Mapping[str, Any]:
+        """
+        Get the metadata of a one-day chart request.
+        
+        fast_info would download a full year of daily bars, .info hits the heavy
+        quoteSummary endpoint, and yfinance's history metadata costs a second
+        intraday request. A single one-day chart request already carries the
+        current and previous prices.
+        
+        Args:
+            ticker: Stripped, upper-case ticker symbol
+            
+        Returns:
+            Chart metadata, empty if the chart has no result
+        """
+        response = self.session.get(CHART_URL.format(urllib.parse.quote(ticker)), 
+                                    params={'range': '1d', 'interval': '1d'})
+        if response.status_code == 429:
+            raise YFRateLimitError()
+        response.raise_for_status()
+        
+        result = response.json()['chart']['result']
+        return result[0]['meta'] if result else {}
+    
+    def _extract_price_from_info(self, info: Mapping[str, Any]) -> Optional[float]:
         """
         Extract price from ticker info using multiple fallback methods.
         
         Args:
-            info: Ticker info dictionary from yfinance
+            info: Ticker info, batched quote or chart metadata
             
         Returns:
             Price as float or None
         """
-        # Priority order for price fields
-        price_fields = [
-            'currentPrice',
-            'regularMarketPrice', 
-            'previousClose',
-            'open'
-        ]
-        
-        # Try direct price fields first
-        for field in price_fields:
-            if field in info and info[field] is not None:
-                try:
-                    price = float(info[field])
-                    if price > 0:
-                        return price
-                except (ValueError, TypeError):
-                    continue
+        # Try direct price fields first, the first usable one wins
+        price = next(filter(None, (_to_price(info.get(field)) for field in PRICE_FIELDS)), None)
+        if price is not None:
+            return price
         
         # Try bid/ask average as fallback
-        if 'bid' in info and 'ask' in info:
+        bid = _to_price(info.get('bid'))
+        ask = _to_price(info.get('ask'))
+        return (bid + ask) * 0.5 if bid and ask else None
+    
+    def _get_crumb(self) -> str:
+        """
+        Get the crumb token required by the quote endpoint.
+        
+        Returns:
+            Crumb string tied to the session cookies
+        """
+        # Concurrent chunk requests must not each run the cookie/crumb handshake
+        with self._crumb_lock:
+            if self._crumb is None:
+                logger.debug("Fetching Yahoo cookie and crumb")
+                # fc.yahoo.com answers 404 but sets the cookie the crumb is bound to
+                self.session.get(COOKIE_URL, allow_redirects=True)
+                response = self.session.get(CRUMB_URL)
+                response.raise_for_status()
+                if not response.text or '<' in response.text:
+                    raise ValueError("Invalid crumb received from Yahoo")
+                self._crumb = response.text
+            return self._crumb
+    
+    def _fetch_quotes(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch quotes for many tickers using batched quote requests.
+        
+        Args:
+            tickers: List of normalized ticker symbols
+            
+        Returns:
+            Dictionary mapping ticker to its quote (missing if unavailable)
+        """
+        quotes = {}
+        chunks = [tickers[start:start + QUOTE_BATCH_SIZE] 
+                  for start in range(0, len(tickers), QUOTE_BATCH_SIZE)]
+        
+        if len(chunks) <= 1:
+            for chunk in chunks:
+                quotes.update(self._fetch_quote_chunk(chunk))
+            return quotes
+        
+        # Large portfolios span several chunks, send them concurrently
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+            for chunk_quotes in executor.map(self._fetch_quote_chunk, chunks):
+                quotes.update(chunk_quotes)
+        
+        return quotes
+    
+    def _fetch_quote_chunk(self, chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch quotes for one chunk of tickers.
+        
+        Args:
+            chunk: Up to QUOTE_BATCH_SIZE normalized ticker symbols
+            
+        Returns:
+            Dictionary mapping ticker to its quote (missing if unavailable)
+        """
+        logger.debug("Requesting quotes for %s", chunk)
+        
+        for attempt in range(QUOTE_ATTEMPTS):
             try:
-                bid = float(info['bid']) if info['bid'] is not None else 0
-                ask = float(info['ask']) if info['ask'] is not None else 0
-                if bid > 0 and ask > 0:
-                    return (bid + ask) / 2
-            except (ValueError, TypeError):
-                pass
+                params = {'symbols': ','.join(chunk), 'crumb': self._get_crumb()}
+                response = self.session.get(QUOTE_URL, params=params)
+                
+                if response.status_code == 401:
+                    # Crumb expired, get a fresh one and try once more
+                    self._crumb = None
+                    params['crumb'] = self._get_crumb()
+                    response = self.session.get(QUOTE_URL, params=params)
+                    
+                response.raise_for_status()
+                return self._parse_quotes(response.json())
+                
+            except Exception as e:
+                delay = self._quote_retry_delay(chunk, e, attempt)
+                if delay is None or self._stop.wait(delay):
+                    self._handle_quote_error(chunk, e)
+                    return {}
+    
+    async def _afetch_quote_chunk(self, session: curl_requests.AsyncSession, chunk: List[str],
+                                  semaphore: asyncio.Semaphore) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch quotes for one chunk of tickers without blocking the event loop.
         
-        return None
+        Args:
+            session: Async session to send the request with
+            chunk: Up to QUOTE_BATCH_SIZE normalized ticker symbols
+            semaphore: Semaphore bounding the number of concurrent requests
+            
+        Returns:
+            Dictionary mapping ticker to its quote (missing if unavailable)
+        """
+        async with semaphore:
+            logger.debug("Requesting quotes for %s", chunk)
+            
+            for attempt in range(QUOTE_ATTEMPTS):
+                try:
+                    # Only hop to a thread when the crumb handshake actually has to run
+                    crumb = self._crumb or await asyncio.to_thread(self._get_crumb)
+                    params = {'symbols': ','.join(chunk), 'crumb': crumb}
+                    # The crumb is bound to the cookies of the sync session
+                    async with self.limiter.ratelimit('yahoo', delay=True):
+                        response = await session.get(QUOTE_URL, params=params, cookies=self.session.cookies)
+                    
+                    if response.status_code == 401:
+                        # Crumb expired, get a fresh one and try once more
+                        self._crumb = None
+                        params['crumb'] = await asyncio.to_thread(self._get_crumb)
+                        async with self.limiter.ratelimit('yahoo', delay=True):
+                            response = await session.get(QUOTE_URL, params=params, cookies=self.session.cookies)
+                    
+                    response.raise_for_status()
+                    return self._parse_quotes(response.json())
+                    
+                except Exception as e:
+                    delay = self._quote_retry_delay(chunk, e, attempt)
+                    if delay is None or await self._await_stop(delay):
+                        self._handle_quote_error(chunk, e)
+                        return {}
+    
+    async def _await_stop(self, timeout: float) -> bool:
+        """
+        Wait on the event loop until the timeout passes or the fetcher is stopped.
+        
+        Args:
+            timeout: Seconds to wait
+            
+        Returns:
+            True if the fetcher was stopped, like threading.Event.wait
+        """
+        # The stop flag is a threading.Event, so poll it in short slices
+        deadline = time.monotonic() + timeout
+        while not self._stop.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(remaining, STOP_POLL_INTERVAL_SECONDS))
+        return True
+    
+    def _parse_quotes(self, data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Index a quote endpoint response by symbol.
+        
+        Args:
+            data: Decoded JSON response of the quote endpoint
+            
+        Returns:
+            Dictionary mapping ticker to its quote
+        """
+        return {quote['symbol']: quote for quote in data['quoteResponse']['result']}
+    
+    def _quote_retry_delay(self, chunk: List[str], error: Exception, attempt: int) -> Optional[float]:
+        """
+        Decide whether a failed quote request should be sent again.
+        
+        Args:
+            chunk: Ticker symbols of the failed request
+            error: Exception raised by the request
+            attempt: Zero-based number of the failed attempt
+            
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        if attempt >= QUOTE_ATTEMPTS - 1 or not _is_transient_error(error):
+            return None
+        
+        delay = min(MAX_RETRY_DELAY_SECONDS, RETRY_DELAY_SECONDS * 2 ** attempt) + random.uniform(0, 1)
+        logger.warning("Quote request for %d tickers failed (%s), retrying in %.1f seconds...", 
+                       len(chunk), error, delay)
+        return delay
+    
+    def _handle_quote_error(self, chunk: List[str], error: Exception) -> None:
+        """
+        Log a failed quote request, re-raising it if Yahoo is rate limiting us.
+        
+        Args:
+            chunk: Ticker symbols of the failed request
+            error: Exception raised by the request
+        """
+        response = getattr(error, 'response', None)
+        if response is not None and response.status_code == 429:
+            # Falling back to per-ticker requests would only make it worse
+            raise error
+        logger.error("Error fetching quotes for %s: %s", chunk, error)
     
     def get_exchange_rate(self, currency_pair: str = "CAD=X") -> Optional[float]:
         """
@@ -108,22 +510,85 @@ class StockDataFetcher:
         Returns:
             Exchange rate or None if unable to fetch
         """
-        logger.debug(f"Fetching exchange rate for {currency_pair}")
+        cached_rate = self._get_cached_rate(currency_pair)
+        if cached_rate is not None:
+            return cached_rate
+            
+        logger.debug("Fetching exchange rate for %s", currency_pair)
         
         try:
-            ticker_obj = yf.Ticker(currency_pair)
-            info = ticker_obj.info
+            rate = self._extract_price_from_info(self._get_chart_metadata(currency_pair))
+            
+            if rate is None:
+                # Fall back to the full info payload
+                info = self._get_info(currency_pair)
+                if info and 'previousClose' in info:
+                    rate = float(info['previousClose'])
             
-            if info and 'previousClose' in info:
-                rate = float(info['previousClose'])
-                logger.debug(f"Exchange rate for {currency_pair}: {rate}")
+            if rate is not None:
+                logger.debug("Exchange rate for %s: %s", currency_pair, rate)
+                self._store_rate(currency_pair, rate)
                 return rate
                 
+        except YFRateLimitError:
+            raise
         except Exception as e:
-            logger.error(f"Error fetching exchange rate for {currency_pair}: {e}")
+            logger.error("Error fetching exchange rate for %s: %s", currency_pair, e)
         
-        logger.warning(f"Could not fetch exchange rate for {currency_pair}")
-        return None
+        return self._get_stale_rate(currency_pair)
+    
+    def _get_cached_rate(self, currency_pair: str) -> Optional[float]:
+        """
+        Get a fresh exchange rate from memory or the disk cache.
+        
+        Args:
+            currency_pair: Currency pair symbol
+            
+        Returns:
+            Exchange rate or None if there is no fresh one
+        """
+        entry = self._rates.get(currency_pair)
+        if entry is not None and time.time() - entry[0] < EXCHANGE_RATE_CACHE_TTL_SECONDS:
+            return entry[1]
+        
+        entry = self.cache.get_entry(currency_pair, 'exchange_rate', EXCHANGE_RATE_CACHE_TTL_SECONDS)
+        if entry is None:
+            return None
+        # Keep it in memory too, so it can stand in if a later refetch fails
+        self._rates[currency_pair] = entry
+        return entry[1]
+    
+    def _store_rate(self, currency_pair: str, rate: float) -> None:
+        """
+        Remember a freshly fetched exchange rate in memory and on disk.
+        
+        Args:
+            currency_pair: Currency pair symbol
+            rate: Exchange rate
+        """
+        self._rates[currency_pair] = (time.time(), rate)
+        self.cache.set(currency_pair, 'exchange_rate', rate)
+    
+    def _get_stale_rate(self, currency_pair: str) -> Optional[float]:
+        """
+        Get the last rate known to this process after a refetch failed.
+        
+        Args:
+            currency_pair: Currency pair symbol
+            
+        Returns:
+            Last known exchange rate, or None if there is none younger than MAX_STALE_RATE_AGE_SECONDS
+        """
+        entry = self._rates.get(currency_pair)
+        age = time.time() - entry[0] if entry is not None else None
+        if age is None or age >= MAX_STALE_RATE_AGE_SECONDS:
+            logger.warning("Could not fetch exchange rate for %s", currency_pair)
+            return None
+        
+        # A slightly old rate beats leaving the conversion cell stale or empty
+        logger.warning("Could not fetch exchange rate for %s, using the one from %.0f seconds ago", 
+                       currency_pair, age)
+        return entry[1]
     
     def get_multiple_prices(self, tickers: List[str]) -> Dict[str, Optional[float]]:
         """
@@ -135,16 +600,216 @@ class StockDataFetcher:
         Returns:
             Dictionary mapping ticker to price (or None if failed)
         """
-        logger.info(f"Fetching prices for {len(tickers)} tickers")
-        results = {}
+        logger.info("Fetching prices for %d tickers", len(tickers))
+        
+        symbol_by_ticker = self._normalize_tickers(tickers)
+        cached_prices, symbols = self._split_cached(symbol_by_ticker)
+        
+        # One request per chunk of symbols instead of one per ticker
+        quotes = self._fetch_quotes(symbols)
+        prices, fallback_symbols = self._collect_prices(symbols, cached_prices, quotes)
+        
+        if fallback_symbols:
+            # Per-ticker lookups are I/O bound, so run them concurrently. The batch
+            # request was already retried, so each lookup only gets one attempt
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(fallback_symbols))) as executor:
+                futures = {executor.submit(self._fetch_shared, symbol, 1): symbol 
+                           for symbol in fallback_symbols}
+                for future in as_completed(futures):
+                    prices[futures[future]] = future.result()
+        
+        results = {ticker: prices.get(symbol_by_ticker.get(ticker)) for ticker in tickers}
         
-        for ticker in tickers:
-            if ticker and ticker.strip():
-                results[ticker] = self.get_ticker_price(ticker)
-            else:
-                results[ticker] = None
-                
         successful_fetches = sum(1 for price in results.values() if price is not None)
-        logger.info(f"Successfully fetched {successful_fetches}/{len(tickers)} prices")
+        logger.info("Successfully fetched %d/%d prices", successful_fetches, len(tickers))
         
         return results
+    
+    async def aget_multiple_prices(self, tickers: List[str]) -> Dict[str, Optional[float]]:
+        """
+        Get prices for multiple tickers with concurrent non-blocking requests.
+        
+        Args:
+            tickers: List of ticker symbols
+            
+        Returns:
+            Dictionary mapping ticker to price (or None if failed)
+        """
+        logger.info("Fetching prices for %d tickers", len(tickers))
+        
+        symbol_by_ticker = self._normalize_tickers(tickers)
+        cached_prices, symbols = self._split_cached(symbol_by_ticker)
+        
+        quotes = {}
+        if symbols:
+            chunk_semaphore = asyncio.Semaphore(ASYNC_MAX_CONCURRENCY)
+            # One pooled connection per concurrent chunk, all to the same host
+            async with curl_requests.AsyncSession(impersonate="chrome", timeout=REQUEST_TIMEOUT,
+                                                  max_clients=ASYNC_MAX_CONCURRENCY) as session:
+                chunks = [symbols[start:start + QUOTE_BATCH_SIZE] 
+                          for start in range(0, len(symbols), QUOTE_BATCH_SIZE)]
+                for chunk_quotes in await asyncio.gather(
+                        *(self._afetch_quote_chunk(session, chunk, chunk_semaphore) for chunk in chunks)):
+                    quotes.update(chunk_quotes)
+        
+        prices, fallback_symbols = self._collect_prices(symbols, cached_prices, quotes)
+        # Fallbacks each tie up a thread, so they keep the thread pool limit
+        fallback_semaphore = asyncio.Semaphore(self.max_workers)
+        
+        async def fetch_fallback(symbol: str) -> None:
+            # yfinance is blocking, so run it in a thread. The batch request was
+            # already retried, so each lookup only gets one attempt
+            async with fallback_semaphore:
+                prices[symbol] = await asyncio.to_thread(self._fetch_shared, symbol, 1)
+        
+        await asyncio.gather(*(fetch_fallback(symbol) for symbol in fallback_symbols))
+        
+        results = {ticker: prices.get(symbol_by_ticker.get(ticker)) for ticker in tickers}
+        
+        successful_fetches = sum(1 for price in results.values() if price is not None)
+        logger.info("Successfully fetched %d/%d prices", successful_fetches, len(tickers))
+        
+        return results
+    
+    async def aget_prices_and_rate(self, tickers: List[str], 
+                                   currency_pair: str = "CAD=X") -> Tuple[Dict[str, Optional[float]], Optional[float]]:
+        """
+        Get ticker prices and an exchange rate from the same batched requests.
+        
+        Args:
+            tickers: List of ticker symbols
+            currency_pair: Currency pair symbol (default: CAD=X)
+            
+        Returns:
+            Tuple of (price by ticker, exchange rate or None)
+        """
+        fetch_tickers, cached_rate = self._plan_rate_fetch(tickers, currency_pair)
+        prices = await self.aget_multiple_prices(fetch_tickers)
+        return prices, self._take_rate(prices, tickers, currency_pair, cached_rate)
+    
+    def get_prices_and_rate(self, tickers: List[str], 
+                            currency_pair: str = "CAD=X") -> Tuple[Dict[str, Optional[float]], Optional[float]]:
+        """
+        Get ticker prices and an exchange rate from the same batched requests.
+        
+        Args:
+            tickers: List of ticker symbols
+            currency_pair: Currency pair symbol (default: CAD=X)
+            
+        Returns:
+            Tuple of (price by ticker, exchange rate or None)
+        """
+        fetch_tickers, cached_rate = self._plan_rate_fetch(tickers, currency_pair)
+        prices = self.get_multiple_prices(fetch_tickers)
+        return prices, self._take_rate(prices, tickers, currency_pair, cached_rate)
+    
+    def _plan_rate_fetch(self, tickers: List[str], 
+                         currency_pair: str) -> Tuple[List[str], Optional[float]]:
+        """
+        Decide which tickers to fetch so the exchange rate comes along with the prices.
+        
+        Args:
+            tickers: List of ticker symbols as given by the caller
+            currency_pair: Currency pair symbol
+            
+        Returns:
+            Tuple of (tickers to fetch, fresh cached rate or None)
+        """
+        cached_rate = self._get_cached_rate(currency_pair)
+        
+        # The pair is just another symbol for the quote endpoint, so ride along. This
+        # beats a parallel get_exchange_rate call, it costs no extra request at all
+        if cached_rate is None and currency_pair not in tickers:
+            return tickers + [currency_pair], None
+        return tickers, cached_rate
+    
+    def _take_rate(self, prices: Dict[str, Optional[float]], tickers: List[str], 
+                   currency_pair: str, cached_rate: Optional[float]) -> Optional[float]:
+        """
+        Get the exchange rate out of a batch planned by _plan_rate_fetch.
+        
+        Args:
+            prices: Fetched price by ticker
+            tickers: List of ticker symbols as given by the caller
+            currency_pair: Currency pair symbol
+            cached_rate: Fresh cached rate returned by _plan_rate_fetch
+            
+        Returns:
+            Exchange rate, or the last known one if it couldn't be fetched
+        """
+        # Drop the pair again if it was only added for the rate
+        rate = prices.get(currency_pair) if currency_pair in tickers else prices.pop(currency_pair, None)
+        if cached_rate is not None:
+            return cached_rate
+        if rate is None:
+            return self._get_stale_rate(currency_pair)
+        
+        self._store_rate(currency_pair, rate)
+        return rate
+    
+    def _normalize_tickers(self, tickers: List[str]) -> Dict[str, str]:
+        """
+        Map each non-empty ticker as given by the caller to its normalized symbol.
+        
+        Args:
+            tickers: List of ticker symbols, possibly padded, lower-case or repeated
+            
+        Returns:
+            Dictionary mapping ticker to its stripped, upper-case symbol
+        """
+        return {ticker: ticker.strip().upper() for ticker in tickers if ticker and ticker.strip()}
+    
+    def _split_cached(self, symbol_by_ticker: Dict[str, str]) -> Tuple[Dict[str, Optional[float]], List[str]]:
+        """
+        Split symbols into fresh cached prices and symbols that need fetching.
+        
+        Args:
+            symbol_by_ticker: Normalized symbol by ticker, as built by _normalize_tickers
+            
+        Returns:
+            Tuple of (cached price by symbol, None for known missing symbols, unique symbols to fetch)
+        """
+        cached_prices = {}
+        symbols = []
+        
+        # Sheets often list a symbol more than once, look each one up a single time
+        for symbol in dict.fromkeys(symbol_by_ticker.values()):
+            price = self.cache.get(symbol, 'price', PRICE_CACHE_TTL_SECONDS)
+            if price is not None:
+                cached_prices[symbol] = price
+            elif self._is_known_missing(symbol):
+                cached_prices[symbol] = None
+            else:
+                symbols.append(symbol)
+        
+        return cached_prices, symbols
+    
+    def _collect_prices(self, symbols: List[str], cached_prices: Dict[str, Optional[float]],
+                        quotes: Dict[str, Dict[str, Any]]) -> Tuple[Dict[str, Optional[float]], List[str]]:
+        """
+        Map symbols to prices from the cache and batched quotes.
+        
+        Args:
+            symbols: Unique symbols that were not cached
+            cached_prices: Fresh cached price by symbol
+            quotes: Batched quotes by symbol
+            
+        Returns:
+            Tuple of (price by symbol, symbols that need a per-ticker lookup)
+        """
+        prices = dict(cached_prices)
+        fallback_symbols = []
+        
+        # Extraction is microseconds per quote, so it stays in this thread. If it ever
+        # grows past ~5% of a cycle, feed the raw quotes to a multiprocessing.Pool
+        for symbol in symbols:
+            quote = quotes.get(symbol)
+            prices[symbol] = self._extract_price_from_info(quote) if quote else None
+            
+            if prices[symbol] is not None:
+                self.cache.set(symbol, 'price', prices[symbol])
+            else:
+                logger.debug("No batched quote for %s, falling back to yfinance", symbol)
+                fallback_symbols.append(symbol)
+        
+        return prices, fallback_symbols
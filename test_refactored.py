@@ -5,6 +5,7 @@ This script tests individual components without running the full application.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from logger import logger
 from stock_fetcher import StockDataFetcher
 from sheets_client import SheetsClient
@@ -15,29 +16,32 @@ def test_stock_fetcher():
     """Test the stock data fetching functionality."""
     logger.info("Testing StockDataFetcher...")
     
-    fetcher = StockDataFetcher()
-    
-    # Test single ticker
-    test_tickers = ['AAPL', 'GOOGL', 'INVALID_TICKER']
-    
-    for ticker in test_tickers:
-        price = fetcher.get_ticker_price(ticker)
-        if price:
-            logger.info(f"✓ {ticker}: ${price:.2f}")
+    with StockDataFetcher() as fetcher:
+        # Test single ticker, all at once since each lookup just waits on the network
+        test_tickers = ['AAPL', 'GOOGL', 'INVALID_TICKER']
+        
+        with ThreadPoolExecutor(max_workers=len(test_tickers)) as executor:
+            futures = {executor.submit(fetcher.get_ticker_price, ticker): ticker 
+                       for ticker in test_tickers}
+            for future in as_completed(futures):
+                ticker = futures[future]
+                price = future.result()
+                if price:
+                    logger.info(f"✓ {ticker}: ${price:.2f}")
+                else:
+                    logger.warning(f"✗ {ticker}: Failed to fetch price")
+        
+        # Test multiple tickers
+        logger.info("Testing multiple ticker fetch...")
+        prices = fetcher.get_multiple_prices(['AAPL', 'MSFT'])
+        logger.info(f"Multiple prices result: {prices}")
+        
+        # Test exchange rate
+        cad_rate = fetcher.get_exchange_rate()
+        if cad_rate:
+            logger.info(f"✓ CAD/USD rate: {cad_rate:.4f}")
         else:
-            logger.warning(f"✗ {ticker}: Failed to fetch price")
-    
-    # Test multiple tickers
-    logger.info("Testing multiple ticker fetch...")
-    prices = fetcher.get_multiple_prices(['AAPL', 'MSFT'])
-    logger.info(f"Multiple prices result: {prices}")
-    
-    # Test exchange rate
-    cad_rate = fetcher.get_exchange_rate()
-    if cad_rate:
-        logger.info(f"✓ CAD/USD rate: {cad_rate:.4f}")
-    else:
-        logger.warning("✗ Failed to fetch CAD exchange rate")
+            logger.warning("✗ Failed to fetch CAD exchange rate")
 
 
 def test_sheets_client():